@@ -1,32 +1,100 @@
 # Final
+import os
 import random
+import sys
 import time
-from collections import Counter
-from itertools import combinations
-
-# ===== Card and Deck Classes =====
-class Card:
-    """Represents a single playing card."""
-    suits = ["♠", "♥", "♦", "♣"]
-    values = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
-
-    def __init__(self, suit, value):
-        self.suit = suit
-        self.value = value
-        self.rank = Card.values.index(value) + 2  # Numeric rank (2-14)
-    
-    def __repr__(self):
-        return f"{self.value}{self.suit}"
+from concurrent.futures import ProcessPoolExecutor
+
+# One generator for shuffles and bot choices, instead of the module-level state
+_RNG = random.Random()
+
+# ===== User Interface =====
+class UI:
+    """Where table output, prompts and pacing delays go."""
+    interactive = False  # True when a human sits at the table
+
+    def show(self, message):
+        """Display one message of table output."""
+
+    def summary(self, message):
+        """Display one line of end-of-game results."""
+        self.show(message)
+
+    def show_board(self, cards):
+        """Display the board cards."""
+        self.show(" ".join(card_str(card) for card in cards))
+
+    def ask(self, prompt):
+        """Prompt for and return a line of input.
+
+        Non-interactive UIs answer '' (skip the pause). Interactive UIs seat a
+        human, whose action prompts never accept '', so they must override this.
+        """
+        if self.interactive:
+            raise NotImplementedError(f"{type(self).__name__} is interactive and must override ask()")
+        return ""
+
+    def delay(self, seconds):
+        """Pause so a human can follow the action."""
+
+class HumanUI(UI):
+    """Terminal play: print, input and real delays."""
+    interactive = True
+
+    def show(self, message):
+        print(message)
+
+    def show_board(self, cards):
+        # Reveal one card at a time on a single line
+        for card in cards:
+            print(card_str(card), end=" ", flush=True)
+            time.sleep(0.8)
+        print()
+
+    def ask(self, prompt):
+        return input(prompt)
+
+    def delay(self, seconds):
+        time.sleep(seconds)
+
+class NullUI(UI):
+    """Self-play: no output, no delays, every prompt answered with ''."""
+
+class QuietUI(NullUI):
+    """Self-play that still prints the end-of-game results."""
+
+    def summary(self, message):
+        print(message)
+
+# ===== Cards and Deck =====
+# Cards are packed integers 0-51: (rank_index << 2) | suit_index, so code reads
+# the rank as c >> 2 (0-12, 2 to A) and the suit as c & 3 inline
+RANK_STR = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+SUIT_STR = ["♠", "♥", "♦", "♣"]
+
+def card_str(card):
+    """Display string for a packed card, e.g. 'A♠'."""
+    return f"{RANK_STR[card >> 2]}{SUIT_STR[card & 3]}"
+
+def cards_str(cards):
+    """Display string for a list of packed cards."""
+    return "[" + ", ".join(card_str(c) for c in cards) + "]"
 
 class Deck:
     """Represents a deck of 52 shuffled cards."""
     def __init__(self):
-        self.cards = [Card(suit, value) for suit in Card.suits for value in Card.values]
-        random.shuffle(self.cards)
+        self.cards = list(range(52))  # every (rank << 2 | suit) once
+        self.shuffle()
+
+    def shuffle(self):
+        """Return all cards to the deck and shuffle in place."""
+        _RNG.shuffle(self.cards)
+        self.top = 52
     
     def deal(self, num):
-        """Deal num cards."""
-        return [self.cards.pop() for _ in range(num)]
+        """Deal num cards from the top of the deck."""
+        self.top -= num
+        return self.cards[self.top:self.top + num]
 
 # ===== Player Class =====
 class Player:
@@ -58,114 +126,197 @@ class Player:
         return f"{self.name} ({self.chips} chips)"
 
 # ===== Hand Evaluator Class =====
+# Hand categories are ints 1-10; names are for display only
+CATEGORY_NAME = ["", "High Card", "One Pair", "Two Pair", "Three of a Kind", "Straight",
+                 "Flush", "Full House", "Four of a Kind", "Straight Flush", "Royal Flush"]
+
+def _straight_top(mask):
+    """Top rank (5-14) of the highest straight in a 13-bit rank mask, else 0."""
+    m = (mask << 1) | (mask >> 12 & 1)  # bit 0 is the ace played low
+    m &= m >> 1 & m >> 2 & m >> 3 & m >> 4
+    return m.bit_length() + 4 if m else 0
+
+def _top_ranks(mask, n):
+    """Ranks (2-14) of the n highest bits in a 13-bit rank mask."""
+    ranks = []
+    while mask and len(ranks) < n:
+        r = mask.bit_length() - 1
+        ranks.append(r + 2)
+        mask ^= 1 << r
+    return ranks
+
 class HandEvaluator:
     """Evaluates poker hands."""
-    hand_ranks = {
-        "High Card": 1,
-        "One Pair": 2,
-        "Two Pair": 3,
-        "Three of a Kind": 4,
-        "Straight": 5,
-        "Flush": 6,
-        "Full House": 7,
-        "Four of a Kind": 8,
-        "Straight Flush": 9,
-        "Royal Flush": 10
-    }
-
     @staticmethod
     def evaluate_hand(cards):
-        suits = [card.suit for card in cards]
-        values = [card.rank for card in cards]
-        value_counts = Counter(values)
-        counts = value_counts.values()
-        unique_vals = sorted(set(values), reverse=True)
-
-        # Check Flush
-        flush = None
-        for suit in Card.suits:
-            if suits.count(suit) >= 5:
-                flush = [card for card in cards if card.suit == suit]
-                flush = sorted(flush, key=lambda c: c.rank, reverse=True)
-                break
-
-        # Check Straight
-        straight = None
-        vals = sorted(set(values))
-        if 14 in vals:
-            vals.insert(0, 1)  # Ace-low straight
-        for i in range(len(vals) - 4):
-            if vals[i+4] - vals[i] == 4 and len(set(vals[i:i+5])) == 5:
-                straight = vals[i+4]
-
-        # Check Straight Flush / Royal Flush
-        if flush:
-            flush_vals = sorted(set(card.rank for card in flush))
-            if 14 in flush_vals:
-                flush_vals.insert(0, 1)
-            for i in range(len(flush_vals) - 4):
-                if flush_vals[i+4] - flush_vals[i] == 4 and len(set(flush_vals[i:i+5])) == 5:
-                    if flush_vals[i+4] == 14:
-                        return ("Royal Flush", [14])
-                    else:
-                        return ("Straight Flush", [flush_vals[i+4]])
+        """Return (category, kickers) for the best 5-card hand in 5-7 cards."""
+        hist = [0] * 13
+        suit_counts = [0, 0, 0, 0]
+        suit_masks = [0, 0, 0, 0]
+        for c in cards:
+            hist[c >> 2] += 1
+            suit_counts[c & 3] += 1
+            suit_masks[c & 3] |= 1 << (c >> 2)
+
+        # Check Flush / Straight Flush / Royal Flush
+        # Seven cards can't hold both a flush and a full house/quads
+        for suit, n in enumerate(suit_counts):
+            if n >= 5:
+                flush_mask = suit_masks[suit]
+                top = _straight_top(flush_mask)
+                if top == 14:
+                    return (10, (14,))
+                if top:
+                    return (9, (top,))
+                return (6, tuple(_top_ranks(flush_mask, 5)))
+
+        # Group ranks (2-14) by multiplicity, highest first
+        quads, trips, pairs, singles = [], [], [], []
+        for r in range(12, -1, -1):
+            n = hist[r]
+            if n == 1:
+                singles.append(r + 2)
+            elif n == 2:
+                pairs.append(r + 2)
+            elif n == 3:
+                trips.append(r + 2)
+            elif n == 4:
+                quads.append(r + 2)
 
         # Four of a Kind
-        if 4 in counts:
-            quad = value_counts.most_common(1)[0][0]
-            kicker = max(v for v in values if v != quad)
-            return ("Four of a Kind", [quad, kicker])
+        if quads:
+            kicker = max(trips[:1] + pairs[:1] + singles[:1])
+            return (8, (quads[0], kicker))
 
         # Full House
-        if 3 in counts and 2 in counts:
-            trips = value_counts.most_common(1)[0][0]
-            pair = [v for v, c in value_counts.items() if c >= 2 and v != trips]
-            return ("Full House", [trips, max(pair)])
-
-        # Flush
-        if flush:
-            return ("Flush", [card.rank for card in flush[:5]])
+        if trips and (len(trips) > 1 or pairs):
+            return (7, (trips[0], max(trips[1:2] + pairs[:1])))
 
         # Straight
+        straight = _straight_top(suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3])
         if straight:
-            return ("Straight", [straight])
+            return (5, (straight,))
 
         # Three of a Kind
-        if 3 in counts:
-            trips = value_counts.most_common(1)[0][0]
-            kickers = sorted([v for v in values if v != trips], reverse=True)[:2]
-            return ("Three of a Kind", [trips] + kickers)
+        if trips:
+            return (4, (trips[0], *singles[:2]))
 
         # Two Pair
-        pairs = [v for v, c in value_counts.items() if c == 2]
         if len(pairs) >= 2:
-            top_two = sorted(pairs, reverse=True)[:2]
-            kicker = max([v for v in values if v not in top_two])
-            return ("Two Pair", top_two + [kicker])
+            kicker = max(pairs[2:3] + singles[:1])
+            return (3, (pairs[0], pairs[1], kicker))
 
         # One Pair
-        if 2 in counts:
-            pair = value_counts.most_common(1)[0][0]
-            kickers = sorted([v for v in values if v != pair], reverse=True)[:3]
-            return ("One Pair", [pair] + kickers)
+        if pairs:
+            return (2, (pairs[0], *singles[:3]))
 
         # High Card
-        return ("High Card", sorted(values, reverse=True)[:5])
+        return (1, tuple(singles[:5]))
+
+# ===== Hand Values =====
+# Every hand maps to a single integer (higher is better), so showdowns
+# compare plain ints.
+def hand_value(category, kickers):
+    """Pack a hand category (1-10) and kickers (2-14) into one comparable integer."""
+    value = category << 20
+    for i, k in enumerate(kickers):
+        value |= k << (16 - 4 * i)
+    return value
+
+def hand_name(value):
+    """Hand name for a packed hand value."""
+    return CATEGORY_NAME[value >> 20]
+
+def evaluate7(cards):
+    """Packed value of the best 5-card hand from hole cards plus board."""
+    return hand_value(*HandEvaluator.evaluate_hand(cards))
+
+# ===== Equity Simulation =====
+def _unseen_cards(hero, board, n_iters, n_opps):
+    """Check simulate() arguments and return the cards still to be dealt."""
+    if n_iters < 1:
+        raise ValueError(f"n_iters must be at least 1, got {n_iters}")
+    if n_opps < 1:
+        raise ValueError(f"n_opps must be at least 1, got {n_opps}")
+    if len(hero) != 2:
+        raise ValueError(f"hero must hold exactly 2 cards, got {len(hero)}")
+    if len(board) > 5:
+        raise ValueError(f"board has {len(board)} cards, at most 5 allowed")
+    for c in (*hero, *board):
+        if c not in range(52):
+            raise ValueError(f"cards must be packed ints 0-51, got {c!r}")
+    known = set(hero) | set(board)
+    if len(known) != len(hero) + len(board):
+        raise ValueError("hero and board cards must all be different")
+    stub = [c for c in range(52) if c not in known]
+    needed = 5 - len(board) + 2 * n_opps
+    if needed > len(stub):
+        raise ValueError(f"{n_opps} opponents need {needed} unseen cards, only {len(stub)} left")
+    return stub
+
+def simulate(hero, board, n_iters, n_opps, rng=_RNG):
+    """Monte-Carlo equity of hero's hole cards against n_opps random hands.
+
+    The unseen board cards and every opponent hand are dealt from the
+    remaining deck each iteration. Ties count as an equal share of the pot.
+    Returns the average share won, from 0.0 to 1.0.
+    """
+    stub = _unseen_cards(hero, board, n_iters, n_opps)
+    board = list(board)
+    hero = list(hero)
+    need = 5 - len(board)
+    share = 0.0
+    for _ in range(n_iters):
+        drawn = rng.sample(stub, need + 2 * n_opps)
+        full_board = board + drawn[:need]
+        hero_value = evaluate7(hero + full_board)
+        ties = 0
+        for i in range(need, need + 2 * n_opps, 2):
+            value = evaluate7(drawn[i:i + 2] + full_board)
+            if value > hero_value:
+                break
+            if value == hero_value:
+                ties += 1
+        else:
+            share += 1.0 / (ties + 1)
+    return share / n_iters
+
+def _simulate_job(job):
+    """Worker entry for equity(): simulate() with its own seeded generator."""
+    hero, board, n_iters, n_opps, seed = job
+    return simulate(hero, board, n_iters, n_opps, random.Random(seed))
+
+def equity(hero, board, n_iters, n_opps, workers=None):
+    """simulate() with the iterations split across worker processes."""
+    _unseen_cards(hero, board, n_iters, n_opps)  # fail here, not in a worker
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    workers = workers or os.cpu_count() or 1
+    chunk, extra = divmod(n_iters, workers)
+    jobs = [(hero, board, chunk + (i < extra), n_opps, _RNG.getrandbits(64))
+            for i in range(workers)]
+    jobs = [job for job in jobs if job[2]]
+    if len(jobs) == 1:
+        return _simulate_job(jobs[0])
+    with ProcessPoolExecutor(len(jobs)) as pool:
+        shares = list(pool.map(_simulate_job, jobs))
+    return sum(share * job[2] for share, job in zip(shares, jobs)) / n_iters
+
 # ===== Helper Functions =====
 
-def print_chip_bars(players):
+def print_chip_bars(players, ui):
     """Display graphical chip bars for each player."""
-    print("\nCurrent Chips:")
+    ui.show("\nCurrent Chips:")
     for p in players:
-        print(f"{p.name}: {p.chip_bar()} ({p.chips})")
-    print("-" * 30)
+        ui.show(f"{p.name}: {p.chip_bar()} ({p.chips})")
+    ui.show("-" * 30)
 
 def deal_hands(players, deck):
     """Deal two cards to each player."""
     for p in players:
         p.hand = deck.deal(2)
 
-def post_blinds(players, dealer_pos, small_blind, big_blind):
+def post_blinds(players, dealer_pos, small_blind, big_blind, ui):
     """Post small and big blinds."""
     sb_player = players[(dealer_pos + 1) % len(players)]
     bb_player = players[(dealer_pos + 2) % len(players)]
@@ -180,18 +331,16 @@ def post_blinds(players, dealer_pos, small_blind, big_blind):
     bb_player.current_bet = bb
     bb_player.total_bet = bb
 
-    print(f"\n{sb_player.name} posts Small Blind: {sb}")
-    print(f"{bb_player.name} posts Big Blind: {bb}")
+    ui.show(f"\n{sb_player.name} posts Small Blind: {sb}")
+    ui.show(f"{bb_player.name} posts Big Blind: {bb}")
 
     return sb + bb
 
-def animate_board(board):
+def animate_board(board, ui):
     """Animate displaying board cards."""
-    print("\nBoard Cards:")
-    for card in board:
-        print(card, end=" ", flush=True)
-        time.sleep(0.8)
-    print("\n" + "-"*30)
+    ui.show("\nBoard Cards:")
+    ui.show_board(board)
+    ui.show("-"*30)
 
 def check_early_winner(players):
     """Check if only one player remains active."""
@@ -209,7 +358,7 @@ def bot_dialogue(action):
         "all-in": ["ALL-IN, baby!", "Go big or go home!", "I'm all-in!"],
         "check": ["I'll check.", "No bet from me.", "Check."]
     }
-    return random.choice(phrases[action])
+    return _RNG.choice(phrases[action])
 
 def log_history(history, hand_num, players, board, pot, winner=None, win_hand=None):
     """Log summary of each hand."""
@@ -223,160 +372,97 @@ def log_history(history, hand_num, players, board, pot, winner=None, win_hand=No
     }
     history.append(entry)
 
-def distribute_pot(players, pot, winner):
+def distribute_pot(players, pot, winner, ui):
     """Distribute pot to winner."""
-    print(f"\n🏆 {winner.name} wins {pot} chips!")
+    ui.show(f"\n🏆 {winner.name} wins {pot} chips!")
     winner.chips += pot
 
-def show_hand_summary(history):
+def show_hand_summary(history, ui):
     """Display previous hand summary."""
     if not history:
         return
     last = history[-1]
-    print("\n=== Previous Hand Summary ===")
-    print(f"Winner: {last['winner']}")
-    print(f"Pot: {last['pot']}")
-    print(f"Board: {last['board']}")
-    print(f"Winning Hand: {last['winning_hand']}")
-    print("-"*35)
-
-def betting_round(players, dealer_pos, min_bet, pot, board):
+    ui.show("\n=== Previous Hand Summary ===")
+    ui.show(f"Winner: {last['winner']}")
+    ui.show(f"Pot: {last['pot']}")
+    ui.show(f"Board: {cards_str(last['board'])}")
+    ui.show(f"Winning Hand: {last['winning_hand']}")
+    ui.show("-"*35)
+
+def betting_round(players, dealer_pos, min_bet, pot, board, ui):
     current_bet = min_bet
     last_raiser = None
-    round_done = False
-
-    while not round_done:
-        round_done = True
-        for i in range(len(players)):
-            player = players[(dealer_pos + 1 + i) % len(players)]
-            if not player.active or player.all_in:
-                continue
-
-            to_call = current_bet - player.current_bet
-
-            print_chip_bars(players)
-            print(f"\n{player.name}'s turn - Pot: {pot}")
-            animate_board(board)
-            if player.is_human:
-                print(f"Your hand: {player.hand}")
-
-            time.sleep(1)
-
-            # ===== Human Player =====
-            if player.is_human:
-                options = []
-                if to_call == 0:
-                    options.append("check")
-                else:
-                    options.append(f"call ({to_call})")
-                if player.chips > to_call and not any(p.all_in for p in players if p != player):
-                    options.append("raise")
-                if player.chips > 0:
-                    options.append("all-in")
-                options.append("fold")
-
-                print(f"Options: {', '.join(options)}")
-
-                while True:
-                    action = input("Choose action: ").lower()
-
-                    if action.startswith("call") and to_call > 0:
-                        call_amt = min(to_call, player.chips)
-                        player.chips -= call_amt
-                        player.current_bet += call_amt
-                        player.total_bet += call_amt
-                        pot += call_amt
-                        print(f"You call {call_amt}.")
-                        if player.chips == 0:
-                            player.all_in = True
-                            print("You are ALL-IN!")
-                        time.sleep(1)
-                        break
-
-                    elif action == "check" and to_call == 0:
-                        print("You checked.")
-                        time.sleep(1)
-                        break
-
-                    elif action == "raise" and player.chips > to_call and not any(p.all_in for p in players if p != player):
-                        while True:
-                            try:
-                                raise_amt = int(input(f"Enter raise amount (min {min_bet}): "))
-                                if raise_amt >= min_bet and raise_amt <= player.chips - to_call:
-                                    break
-                            except:
-                                continue
-                        total_raise = to_call + raise_amt
-                        player.chips -= total_raise
-                        player.current_bet += total_raise
-                        player.total_bet += total_raise
-                        pot += total_raise
-                        current_bet = player.current_bet
-                        last_raiser = player
-                        print(f"You raised to {current_bet}.")
-                        round_done = False
-                        time.sleep(1)
-                        break
-
-                    elif action == "all-in":
-                        all_in_amt = player.chips
-                        player.current_bet += all_in_amt
-                        player.total_bet += all_in_amt
-                        pot += all_in_amt
-                        player.chips = 0
-                        player.all_in = True
-                        print(f"You go ALL-IN with {all_in_amt}!")
-                        time.sleep(1)
-                        break
+    active_count = sum(1 for p in players if p.active)
+    all_in_count = sum(1 for p in players if p.all_in)
+    matched = 0  # players who have acted and match current_bet
+    seat = dealer_pos + 1
+
+    # Done once everyone still betting has matched the last raise
+    while matched + all_in_count < active_count:
+        player = players[seat % len(players)]
+        seat += 1
+        if not player.active or player.all_in:
+            continue
 
-                    elif action == "fold":
-                        player.active = False
-                        print("You folded.")
-                        time.sleep(1)
-                        break
+        to_call = current_bet - player.current_bet
+        others_all_in = all_in_count > 0
 
-                    else:
-                        print("Invalid option. Please choose again.")
+        print_chip_bars(players, ui)
+        ui.show(f"\n{player.name}'s turn - Pot: {pot}")
+        animate_board(board, ui)
+        if player.is_human:
+            ui.show(f"Your hand: {cards_str(player.hand)}")
 
-            # ===== Bot Players =====
+        ui.delay(1)
+
+        # ===== Human Player =====
+        if player.is_human:
+            options = []
+            if to_call == 0:
+                options.append("check")
             else:
-                time.sleep(random.uniform(1.2, 2.0))  # Natural delay
-                decision = "call"
-                if player.chips <= to_call:
-                    decision = "call"
-                else:
-                    r = random.random()
-                    if r < 0.2:
-                        decision = "fold"
-                    elif r < 0.4 and not any(p.all_in for p in players if p != player):
-                        decision = "raise"
-                    else:
-                        decision = "call"
+                options.append(f"call ({to_call})")
+            if player.chips > to_call and not others_all_in:
+                options.append("raise")
+            if player.chips > 0:
+                options.append("all-in")
+            options.append("fold")
 
-                print(f"{player.name}: {bot_dialogue(decision)}")
-                time.sleep(1)
+            ui.show(f"Options: {', '.join(options)}")
 
-                if decision == "fold":
-                    player.active = False
-                    print(f"{player.name} folds.")
-                    time.sleep(1.2)
-                    continue
+            while True:
+                action = ui.ask("Choose action: ").lower()
 
-                elif decision == "call":
+                if action.startswith("call") and to_call > 0:
                     call_amt = min(to_call, player.chips)
                     player.chips -= call_amt
                     player.current_bet += call_amt
                     player.total_bet += call_amt
                     pot += call_amt
+                    ui.show(f"You call {call_amt}.")
                     if player.chips == 0:
                         player.all_in = True
-                        print(f"{player.name} is ALL-IN!")
+                        all_in_count += 1
+                        ui.show("You are ALL-IN!")
                     else:
-                        print(f"{player.name} calls {call_amt}.")
-                    time.sleep(1.2)
-
-                elif decision == "raise":
-                    raise_amt = min(min_bet * 2, player.chips - to_call)
+                        matched += 1
+                    ui.delay(1)
+                    break
+
+                elif action == "check" and to_call == 0:
+                    ui.show("You checked.")
+                    matched += 1
+                    ui.delay(1)
+                    break
+
+                elif action == "raise" and player.chips > to_call and not others_all_in:
+                    while True:
+                        try:
+                            raise_amt = int(ui.ask(f"Enter raise amount (min {min_bet}): "))
+                            if raise_amt >= min_bet and raise_amt <= player.chips - to_call:
+                                break
+                        except:
+                            continue
                     total_raise = to_call + raise_amt
                     player.chips -= total_raise
                     player.current_bet += total_raise
@@ -384,18 +470,88 @@ def betting_round(players, dealer_pos, min_bet, pot, board):
                     pot += total_raise
                     current_bet = player.current_bet
                     last_raiser = player
-                    print(f"{player.name} raises to {current_bet}.")
-                    round_done = False
-                    time.sleep(1.5)
-
-            # ===== Early Winner Check =====
-            remaining = [p for p in players if p.active]
-            if len(remaining) == 1:
-                return pot, True, remaining[0]
-        
-        # Check if betting round done
-        if all((p.current_bet == current_bet or p.all_in or not p.active) for p in players):
-            round_done = True
+                    ui.show(f"You raised to {current_bet}.")
+                    matched = 1
+                    ui.delay(1)
+                    break
+
+                elif action == "all-in":
+                    all_in_amt = player.chips
+                    player.current_bet += all_in_amt
+                    player.total_bet += all_in_amt
+                    pot += all_in_amt
+                    player.chips = 0
+                    player.all_in = True
+                    all_in_count += 1
+                    ui.show(f"You go ALL-IN with {all_in_amt}!")
+                    ui.delay(1)
+                    break
+
+                elif action == "fold":
+                    player.active = False
+                    active_count -= 1
+                    ui.show("You folded.")
+                    ui.delay(1)
+                    if active_count == 1:
+                        return pot, True, next(p for p in players if p.active)
+                    break
+
+                else:
+                    ui.show("Invalid option. Please choose again.")
+
+        # ===== Bot Players =====
+        else:
+            ui.delay(_RNG.uniform(1.2, 2.0))  # Natural delay
+            decision = "call"
+            if player.chips <= to_call:
+                decision = "call"
+            else:
+                r = _RNG.random()
+                if r < 0.2:
+                    decision = "fold"
+                elif r < 0.4 and not others_all_in:
+                    decision = "raise"
+                else:
+                    decision = "call"
+
+            ui.show(f"{player.name}: {bot_dialogue(decision)}")
+            ui.delay(1)
+
+            if decision == "fold":
+                player.active = False
+                active_count -= 1
+                ui.show(f"{player.name} folds.")
+                ui.delay(1.2)
+                if active_count == 1:
+                    return pot, True, next(p for p in players if p.active)
+
+            elif decision == "call":
+                call_amt = min(to_call, player.chips)
+                player.chips -= call_amt
+                player.current_bet += call_amt
+                player.total_bet += call_amt
+                pot += call_amt
+                if player.chips == 0:
+                    player.all_in = True
+                    all_in_count += 1
+                    ui.show(f"{player.name} is ALL-IN!")
+                else:
+                    matched += 1
+                    ui.show(f"{player.name} calls {call_amt}.")
+                ui.delay(1.2)
+
+            elif decision == "raise":
+                raise_amt = min(min_bet * 2, player.chips - to_call)
+                total_raise = to_call + raise_amt
+                player.chips -= total_raise
+                player.current_bet += total_raise
+                player.total_bet += total_raise
+                pot += total_raise
+                current_bet = player.current_bet
+                last_raiser = player
+                ui.show(f"{player.name} raises to {current_bet}.")
+                matched = 1
+                ui.delay(1.5)
 
     # Reset current bets
     for p in players:
@@ -403,43 +559,49 @@ def betting_round(players, dealer_pos, min_bet, pot, board):
 
     return pot, False, None
 
-def determine_winner(players, board):
+def determine_winner(players, board, ui):
     """Determine winner based on best hand."""
     remaining = [p for p in players if p.active or p.all_in]
     rankings = []
 
-    print("\n--- Showdown ---")
-    time.sleep(1)
+    ui.show("\n--- Showdown ---")
+    ui.delay(1)
 
     for p in remaining:
-        combined = p.hand + board
-        best = max([HandEvaluator.evaluate_hand(list(c)) 
-                    for c in combinations(combined, 5)], 
-                    key=lambda x: (HandEvaluator.hand_ranks[x[0]], x[1]))
-        rankings.append((p, best))
-        print(f"{p.name} hand: {p.hand} | {best[0]}")
-        time.sleep(1)
+        value = evaluate7(p.hand + board)
+        rankings.append((p, value))
+        ui.show(f"{p.name} hand: {cards_str(p.hand)} | {hand_name(value)}")
+        ui.delay(1)
 
     # Sort by hand strength
-    rankings.sort(key=lambda x: (HandEvaluator.hand_ranks[x[1][0]], x[1][1]), reverse=True)
+    rankings.sort(key=lambda x: x[1], reverse=True)
     
     # Check for split pot
-    top_hand = rankings[0][1]
-    winners = [p for p, hand in rankings if hand == top_hand]
+    top_value = rankings[0][1]
+    winners = [p for p, value in rankings if value == top_value]
     
     if len(winners) > 1:
-        print("\n🤝 Split Pot!")
-        return winners, top_hand[0]
+        ui.show("\n🤝 Split Pot!")
+        return winners, hand_name(top_value)
     else:
-        return [rankings[0][0]], top_hand[0]
+        return [rankings[0][0]], hand_name(top_value)
 
 # ====== Main Game Loop ======
-def play_game():
+# (title, cards dealt to the board) for each betting round
+STREETS = [
+    ("PRE-FLOP", 0),
+    ("💥 FLOP", 3),
+    ("🔥 TURN", 1),
+    ("🔥 RIVER", 1)
+]
+
+def play_game(ui=None):
+    ui = ui or HumanUI()
     players = [
         Player("Bot 1"),
         Player("Bot 2"),
         Player("Bot 3"),
-        Player("You", is_human=True)
+        Player("You", is_human=ui.interactive)
     ]
 
     dealer_pos = 0
@@ -447,97 +609,64 @@ def play_game():
     big_blind = 1000
     hand_num = 1
     history = []
+    deck = Deck()
+    board = []  # reused each hand; log_history keeps its own copy
 
     while True:
-        print(f"\n========== Hand #{hand_num} ==========")
+        ui.show(f"\n========== Hand #{hand_num} ==========")
         active_players = [p for p in players if p.chips > 0]
         if len(active_players) < 2:
-            print("\n🏆 GAME OVER!")
+            ui.summary("\n🏆 GAME OVER!")
             winner = active_players[0]
-            print(f"🏆 Ultimate Winner: {winner.name} with {winner.chips} chips!")
+            ui.summary(f"🏆 Ultimate Winner: {winner.name} with {winner.chips} chips!")
             break
 
         if history:
-            show_hand_summary(history)
+            show_hand_summary(history, ui)
 
         # Reset players
         for p in players:
             p.reset_for_round()
 
-        deck = Deck()
-        board = []
+        deck.shuffle()
+        board.clear()
         pot = 0
 
         # Deal cards
         deal_hands(players, deck)
 
         # Post blinds
-        pot += post_blinds(players, dealer_pos, small_blind, big_blind)
-
-        # ===== Pre-flop =====
-        pot, early, winner = betting_round(players, dealer_pos, big_blind, pot, board)
-        if early:
-            distribute_pot(players, pot, winner)
-            log_history(history, hand_num, players, board, pot, winner)
-            dealer_pos = (dealer_pos + 1) % len(players)
-            hand_num += 1
-            input("\nPress Enter for next hand...")
-            continue
-
-        # ===== Flop =====
-        board.extend(deck.deal(3))
-        print("\n💥 FLOP")
-        animate_board(board)
-        pot, early, winner = betting_round(players, dealer_pos, big_blind, pot, board)
-        if early:
-            distribute_pot(players, pot, winner)
-            log_history(history, hand_num, players, board, pot, winner)
-            dealer_pos = (dealer_pos + 1) % len(players)
-            hand_num += 1
-            input("\nPress Enter for next hand...")
-            continue
-
-        # ===== Turn =====
-        board.extend(deck.deal(1))
-        print("\n🔥 TURN")
-        animate_board(board)
-        pot, early, winner = betting_round(players, dealer_pos, big_blind, pot, board)
-        if early:
-            distribute_pot(players, pot, winner)
-            log_history(history, hand_num, players, board, pot, winner)
-            dealer_pos = (dealer_pos + 1) % len(players)
-            hand_num += 1
-            input("\nPress Enter for next hand...")
-            continue
-
-        # ===== River =====
-        board.extend(deck.deal(1))
-        print("\n🔥 RIVER")
-        animate_board(board)
-        pot, early, winner = betting_round(players, dealer_pos, big_blind, pot, board)
-        if early:
-            distribute_pot(players, pot, winner)
-            log_history(history, hand_num, players, board, pot, winner)
-            dealer_pos = (dealer_pos + 1) % len(players)
-            hand_num += 1
-            input("\nPress Enter for next hand...")
-            continue
-
-        # ===== Showdown =====
-        winners, win_hand = determine_winner(players, board)
-        split_pot = pot // len(winners)
-        for w in winners:
-            distribute_pot(players, split_pot, w)
-        log_history(history, hand_num, players, board, pot, winners[0], win_hand)
+        pot += post_blinds(players, dealer_pos, small_blind, big_blind, ui)
+
+        for title, num_cards in STREETS:
+            if num_cards:
+                board.extend(deck.deal(num_cards))
+                ui.show(f"\n{title}")
+                animate_board(board, ui)
+            pot, early, winner = betting_round(players, dealer_pos, big_blind, pot, board, ui)
+            if early:
+                distribute_pot(players, pot, winner, ui)
+                log_history(history, hand_num, players, board, pot, winner)
+                break
+        else:
+            # ===== Showdown =====
+            winners, win_hand = determine_winner(players, board, ui)
+            split_pot = pot // len(winners)
+            for w in winners:
+                distribute_pot(players, split_pot, w, ui)
+            log_history(history, hand_num, players, board, pot, winners[0], win_hand)
 
         dealer_pos = (dealer_pos + 1) % len(players)
         hand_num += 1
-        input("\nPress Enter for next hand...")
+        ui.ask("\nPress Enter for next hand...")
 
     # ===== Game Summary =====
-    print("\n===== Game Summary =====")
+    ui.summary("\n===== Game Summary =====")
     for entry in history:
-        print(f"Hand #{entry['hand']}: Winner - {entry['winner']}, Pot: {entry['pot']}, Board: {entry['board']}, Hand: {entry['winning_hand']}")
+        ui.summary(f"Hand #{entry['hand']}: Winner - {entry['winner']}, Pot: {entry['pot']}, Board: {cards_str(entry['board'])}, Hand: {entry['winning_hand']}")
 
 # ===== Run the game =====
-play_game()
+# Guarded so equity() worker processes can import this file
+if __name__ == "__main__":
+    # --fast: bots only, no output, delays or prompts until the final summary
+    play_game(QuietUI() if "--fast" in sys.argv else HumanUI())